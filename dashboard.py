@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 import duckdb
@@ -10,17 +13,48 @@ PROJECT_ROOT = Path(__file__).resolve().parent
 DB_PATH = PROJECT_ROOT / "data" / "nba.duckdb"
 
 
+@st.cache_resource
+def get_connection() -> tuple[duckdb.DuckDBPyConnection, threading.Lock]:
+    # One configured in-memory DuckDB instance for the app's lifetime. The
+    # database file is attached only while a load runs: a handle held open
+    # between refreshes would block scripts/run_daily.py from taking the write lock.
+    con = duckdb.connect(config={"threads": 2, "memory_limit": "1GB"})
+    return con, threading.Lock()
+
+
+@contextmanager
+def _attached_db() -> Iterator[duckdb.DuckDBPyConnection]:
+    con, lock = get_connection()
+    with lock:
+        db_path = str(DB_PATH).replace("'", "''")
+        con.execute(f"ATTACH '{db_path}' AS nba (READ_ONLY)")
+        try:
+            con.execute("USE nba")
+            yield con
+        finally:
+            con.execute("USE memory")
+            con.execute("DETACH nba")
+
+
+def _query_df(con: duckdb.DuckDBPyConnection, sql: str, params: list[object] | None = None) -> pd.DataFrame:
+    # Arrow hand-off from DuckDB, then a block-per-column conversion that skips
+    # pandas' consolidation copy and frees Arrow buffers as it goes.
+    table = con.execute(sql, params or []).to_arrow_table()
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
 @st.cache_data(ttl=300)
-def load_data() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    with duckdb.connect(str(DB_PATH), read_only=True) as con:
-        runs = con.execute("SELECT * FROM gold_runs ORDER BY run_ts DESC").fetch_df()
+def load_data() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    with _attached_db() as con:
+        runs = _query_df(con, "SELECT * FROM gold_runs ORDER BY run_ts DESC LIMIT 1")
         if runs.empty:
-            return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+            return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
 
         season = int(runs.iloc[0]["season"])
         run_ts = runs.iloc[0]["run_ts"]
 
-        champs = con.execute(
+        champs = _query_df(
+            con,
             """
             SELECT team_name, championship_odds
             FROM gold_championship_odds
@@ -28,27 +62,32 @@ def load_data() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]
             ORDER BY championship_odds DESC
             """,
             [season, run_ts],
-        ).fetch_df()
-        conf = con.execute(
+        )
+        east, west = (
+            _query_df(
+                con,
+                """
+                SELECT team_name, ROUND(conference_odds * 100, 2) AS "Conference Odds (%)"
+                FROM gold_conference_odds
+                WHERE season = ? AND run_ts = ? AND conference = ?
+                ORDER BY conference_odds DESC
+                """,
+                [season, run_ts, conference],
+            )
+            for conference in ("East", "West")
+        )
+        finals = _query_df(
+            con,
             """
-            SELECT conference, team_name, conference_odds
-            FROM gold_conference_odds
-            WHERE season = ? AND run_ts = ?
-            ORDER BY conference, conference_odds DESC
-            """,
-            [season, run_ts],
-        ).fetch_df()
-        finals = con.execute(
-            """
-            SELECT matchup, probability
+            SELECT matchup, ROUND(probability * 100, 2) AS "Probability (%)"
             FROM gold_finals_matchups
             WHERE season = ? AND run_ts = ?
             ORDER BY probability DESC
             LIMIT 10
             """,
             [season, run_ts],
-        ).fetch_df()
-    return champs, conf, finals, runs.head(1)
+        )
+    return champs, east, west, finals, runs
 
 
 def main() -> None:
@@ -59,29 +98,22 @@ def main() -> None:
         st.warning("DuckDB file not found. Run scripts/run_daily.py first.")
         return
 
-    champs, conf, finals, runs = load_data()
+    champs, east, west, finals, runs = load_data()
     if runs.empty:
         st.warning("No gold outputs found. Run scripts/run_daily.py first.")
         return
 
     st.caption(f"Last updated: {runs.iloc[0]['run_ts']}")
     st.subheader("Title Odds")
-    st.bar_chart(champs.set_index("team_name")["championship_odds"])
+    st.bar_chart(champs, x="team_name", y="championship_odds")
 
     st.subheader("Conference Win Odds")
     left, right = st.columns(2)
-    east = conf[conf["conference"] == "East"].copy()
-    west = conf[conf["conference"] == "West"].copy()
-
-    east["conference_odds"] = (east["conference_odds"] * 100).round(2)
-    west["conference_odds"] = (west["conference_odds"] * 100).round(2)
-    left.dataframe(east.rename(columns={"conference_odds": "Conference Odds (%)"}), hide_index=True)
-    right.dataframe(west.rename(columns={"conference_odds": "Conference Odds (%)"}), hide_index=True)
+    left.dataframe(east, hide_index=True)
+    right.dataframe(west, hide_index=True)
 
     st.subheader("Most Likely Finals Matchups")
-    finals_out = finals.copy()
-    finals_out["probability"] = (finals_out["probability"] * 100).round(2)
-    st.dataframe(finals_out.rename(columns={"probability": "Probability (%)"}), hide_index=True)
+    st.dataframe(finals, hide_index=True)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
+import threading
 import time
+from pathlib import Path
 from typing import Any
 
 import requests
@@ -18,12 +22,17 @@ class BallDontLieClient:
         timeout: int = 30,
         min_request_interval_seconds: float = 0.0,
         max_retries: int = 5,
+        cache_dir: Path | None = None,
+        cache_ttl_seconds: float = 0.0,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.min_request_interval_seconds = max(0.0, min_request_interval_seconds)
         self.max_retries = max(1, max_retries)
         self._last_request_ts = 0.0
+        self._rate_lock = threading.Lock()
+        self.cache_dir = cache_dir
+        self.cache_ttl_seconds = max(0.0, cache_ttl_seconds)
         self.api_key = (api_key or os.getenv("BALLDONTLIE_API_KEY") or "").strip()
         if not self.api_key:
             raise RuntimeError(
@@ -40,18 +49,78 @@ class BallDontLieClient:
             }
         )
 
+    def _cache_path(self, url: str, params: dict[str, Any]) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        key = json.dumps([url, sorted(params.items())], default=str)
+        return self.cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def _read_cache(self, path: Path | None) -> dict[str, Any] | None:
+        if path is None or not path.exists():
+            return None
+        try:
+            with path.open("r", encoding="utf-8") as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable HTTP cache entry %s", path)
+            return None
+
+    def _write_cache(self, path: Path | None, entry: dict[str, Any]) -> None:
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as fh:
+            json.dump(entry, fh)
+        tmp_path.replace(path)
+
+    def _wait_for_request_slot(self) -> None:
+        # Reserve the next send slot under the lock so concurrent callers stay
+        # min_request_interval_seconds apart, then sleep outside it.
+        with self._rate_lock:
+            now = time.time()
+            slot = max(now, self._last_request_ts + self.min_request_interval_seconds)
+            self._last_request_ts = slot
+        if slot > now:
+            time.sleep(slot - now)
+
     def _request(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        cache_path = self._cache_path(url, params)
+        cached = self._read_cache(cache_path)
+        if cached is not None and time.time() - cached["fetched_at"] < self.cache_ttl_seconds:
+            logger.debug("HTTP cache hit for %s %s", url, params)
+            return cached["payload"]
+
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
         for attempt in range(1, self.max_retries + 1):
-            elapsed = time.time() - self._last_request_ts
-            if elapsed < self.min_request_interval_seconds:
-                time.sleep(self.min_request_interval_seconds - elapsed)
+            self._wait_for_request_slot()
 
             try:
-                response = self.session.get(url, params=params, timeout=self.timeout)
-                self._last_request_ts = time.time()
+                response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+                fetched_at = time.time()
+                if response.status_code == 304 and cached is not None:
+                    cached["fetched_at"] = fetched_at
+                    self._write_cache(cache_path, cached)
+                    return cached["payload"]
                 response.raise_for_status()
-                return response.json()
+                payload = response.json()
+                self._write_cache(
+                    cache_path,
+                    {
+                        "fetched_at": fetched_at,
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                        "payload": payload,
+                    },
+                )
+                return payload
             except requests.HTTPError as exc:
                 status = exc.response.status_code if exc.response is not None else None
                 if status == 429 and attempt < self.max_retries:
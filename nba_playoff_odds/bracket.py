@@ -6,6 +6,9 @@ from collections import defaultdict
 from nba_playoff_odds.elo import expected_home_win_prob, update_elo
 from nba_playoff_odds.models import SeededTeam, TeamStanding
 
+# Home-court pattern for the higher seed in a best-of-7 (2-2-1-1-1).
+SCHEDULE_HIGH_HOME = (True, True, False, False, True, False, True)
+
 
 def build_playoff_field(standings: list[TeamStanding]) -> dict[str, list[SeededTeam]]:
     conference_groups: dict[str, list[TeamStanding]] = defaultdict(list)
@@ -31,35 +34,37 @@ def build_playoff_field(standings: list[TeamStanding]) -> dict[str, list[SeededT
     return field
 
 
+def order_playoff_field(playoff_field: dict[str, list[SeededTeam]]) -> list[SeededTeam]:
+    # Dense team index used by the simulators: East seeds 1-8, then West seeds 1-8.
+    teams: list[SeededTeam] = []
+    for conference in ("East", "West"):
+        by_seed = {t.seed: t for t in playoff_field[conference]}
+        teams.extend(by_seed[seed] for seed in range(1, 9))
+    return teams
+
+
 def _simulate_series(
-    high_seed: SeededTeam,
-    low_seed: SeededTeam,
-    ratings: dict[int, float],
+    high: int,
+    low: int,
+    ratings: list[float],
     rng: random.Random,
     k_factor: float,
     home_court_adv: float,
-) -> SeededTeam:
+) -> int:
     high_wins = 0
     low_wins = 0
-    schedule_high_home = [True, True, False, False, True, False, True]
 
-    for high_is_home in schedule_high_home:
+    for high_is_home in SCHEDULE_HIGH_HOME:
         if high_wins == 4 or low_wins == 4:
             break
 
-        if high_is_home:
-            home = high_seed
-            away = low_seed
-        else:
-            home = low_seed
-            away = high_seed
-
-        home_elo = ratings.get(home.team_id, 1500.0)
-        away_elo = ratings.get(away.team_id, 1500.0)
+        home, away = (high, low) if high_is_home else (low, high)
+        home_elo = ratings[home]
+        away_elo = ratings[away]
         home_prob = expected_home_win_prob(home_elo, away_elo, home_court_adv)
         home_won = rng.random() < home_prob
 
-        ratings[home.team_id], ratings[away.team_id] = update_elo(
+        ratings[home], ratings[away] = update_elo(
             home_elo=home_elo,
             away_elo=away_elo,
             home_won=home_won,
@@ -67,37 +72,30 @@ def _simulate_series(
             home_court_adv=home_court_adv,
         )
 
-        high_team_won = (home.team_id == high_seed.team_id and home_won) or (
-            away.team_id == high_seed.team_id and not home_won
-        )
-        if high_team_won:
+        if home_won == high_is_home:
             high_wins += 1
         else:
             low_wins += 1
 
-    return high_seed if high_wins > low_wins else low_seed
+    return high if high_wins > low_wins else low
 
 
 def _series_with_home_court(
-    team_a: SeededTeam,
-    team_b: SeededTeam,
-    ratings: dict[int, float],
+    a: int,
+    b: int,
+    teams: list[SeededTeam],
+    ratings: list[float],
     rng: random.Random,
     k_factor: float,
     home_court_adv: float,
-) -> SeededTeam:
-    if team_a.seed < team_b.seed:
-        return _simulate_series(team_a, team_b, ratings, rng, k_factor, home_court_adv)
-    if team_b.seed < team_a.seed:
-        return _simulate_series(team_b, team_a, ratings, rng, k_factor, home_court_adv)
-    return _simulate_series(
-        team_a if ratings.get(team_a.team_id, 1500.0) >= ratings.get(team_b.team_id, 1500.0) else team_b,
-        team_b if ratings.get(team_a.team_id, 1500.0) >= ratings.get(team_b.team_id, 1500.0) else team_a,
-        ratings,
-        rng,
-        k_factor,
-        home_court_adv,
-    )
+) -> int:
+    if teams[a].seed < teams[b].seed:
+        return _simulate_series(a, b, ratings, rng, k_factor, home_court_adv)
+    if teams[b].seed < teams[a].seed:
+        return _simulate_series(b, a, ratings, rng, k_factor, home_court_adv)
+    if ratings[a] >= ratings[b]:
+        return _simulate_series(a, b, ratings, rng, k_factor, home_court_adv)
+    return _simulate_series(b, a, ratings, rng, k_factor, home_court_adv)
 
 
 def simulate_playoffs(
@@ -107,28 +105,26 @@ def simulate_playoffs(
     k_factor: float,
     home_court_adv: float,
 ) -> tuple[SeededTeam, SeededTeam, SeededTeam]:
-    conf_champs: dict[str, SeededTeam] = {}
-
-    for conference in ("East", "West"):
-        teams = playoff_field[conference]
-        by_seed = {t.seed: t for t in teams}
-
-        qf1 = _simulate_series(by_seed[1], by_seed[8], ratings, rng, k_factor, home_court_adv)
-        qf2 = _simulate_series(by_seed[4], by_seed[5], ratings, rng, k_factor, home_court_adv)
-        qf3 = _simulate_series(by_seed[2], by_seed[7], ratings, rng, k_factor, home_court_adv)
-        qf4 = _simulate_series(by_seed[3], by_seed[6], ratings, rng, k_factor, home_court_adv)
-
-        sf1 = _series_with_home_court(qf1, qf2, ratings, rng, k_factor, home_court_adv)
-        sf2 = _series_with_home_court(qf3, qf4, ratings, rng, k_factor, home_court_adv)
-        conf_champs[conference] = _series_with_home_court(sf1, sf2, ratings, rng, k_factor, home_court_adv)
-
-    east = conf_champs["East"]
-    west = conf_champs["West"]
-
-    east_rating = ratings.get(east.team_id, 1500.0)
-    west_rating = ratings.get(west.team_id, 1500.0)
-    if east_rating >= west_rating:
-        champion = _simulate_series(east, west, ratings, rng, k_factor, home_court_adv)
+    teams = order_playoff_field(playoff_field)
+    dense = [ratings.get(t.team_id, 1500.0) for t in teams]
+    conf_champs: list[int] = []
+
+    for offset in (0, 8):
+        qf1 = _simulate_series(offset + 0, offset + 7, dense, rng, k_factor, home_court_adv)
+        qf2 = _simulate_series(offset + 3, offset + 4, dense, rng, k_factor, home_court_adv)
+        qf3 = _simulate_series(offset + 1, offset + 6, dense, rng, k_factor, home_court_adv)
+        qf4 = _simulate_series(offset + 2, offset + 5, dense, rng, k_factor, home_court_adv)
+
+        sf1 = _series_with_home_court(qf1, qf2, teams, dense, rng, k_factor, home_court_adv)
+        sf2 = _series_with_home_court(qf3, qf4, teams, dense, rng, k_factor, home_court_adv)
+        conf_champs.append(_series_with_home_court(sf1, sf2, teams, dense, rng, k_factor, home_court_adv))
+
+    east, west = conf_champs
+    if dense[east] >= dense[west]:
+        champion = _simulate_series(east, west, dense, rng, k_factor, home_court_adv)
     else:
-        champion = _simulate_series(west, east, ratings, rng, k_factor, home_court_adv)
-    return champion, east, west
+        champion = _simulate_series(west, east, dense, rng, k_factor, home_court_adv)
+
+    for team, rating in zip(teams, dense):
+        ratings[team.team_id] = rating
+    return teams[champion], teams[east], teams[west]
@@ -3,11 +3,13 @@ from __future__ import annotations
 import logging
 import os
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
 from dotenv import load_dotenv
 
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
 
 @dataclass(frozen=True)
 class Settings:
@@ -21,14 +23,16 @@ class Settings:
     default_k_factor: float
     default_home_court_adv: float
     default_simulations: int
+    default_workers: int
     min_request_interval_seconds: float
+    http_cache_dir: Path
+    http_cache_ttl_seconds: float
 
     @staticmethod
     def from_env() -> "Settings":
-        project_root = Path(__file__).resolve().parent.parent
-        data_dir = project_root / "data"
+        data_dir = _PROJECT_ROOT / "data"
         return Settings(
-            project_root=project_root,
+            project_root=_PROJECT_ROOT,
             data_dir=data_dir,
             bronze_dir=data_dir / "bronze",
             silver_dir=data_dir / "silver",
@@ -38,7 +42,10 @@ class Settings:
             default_k_factor=float(os.getenv("ELO_K_FACTOR", "20")),
             default_home_court_adv=float(os.getenv("ELO_HOME_COURT_ADV", "65")),
             default_simulations=int(os.getenv("MONTE_CARLO_SIMS", "10000")),
+            default_workers=int(os.getenv("MONTE_CARLO_WORKERS", "1")),
             min_request_interval_seconds=float(os.getenv("BDL_MIN_REQUEST_INTERVAL_SECONDS", "12.5")),
+            http_cache_dir=data_dir / "http_cache",
+            http_cache_ttl_seconds=float(os.getenv("BDL_HTTP_CACHE_TTL_SECONDS", "21600")),
         )
 
 
@@ -50,8 +57,7 @@ def configure_logging() -> None:
 
 
 def load_settings() -> Settings:
-    settings = Settings.from_env()
-    load_dotenv(dotenv_path=settings.project_root / ".env", override=False)
+    load_dotenv(dotenv_path=_PROJECT_ROOT / ".env", override=False)
     load_dotenv(override=False)
     settings = Settings.from_env()
     settings.bronze_dir.mkdir(parents=True, exist_ok=True)
@@ -61,5 +67,5 @@ def load_settings() -> Settings:
 
 
 def infer_season(today: datetime | None = None) -> int:
-    now = today or datetime.utcnow()
+    now = today or datetime.now(timezone.utc)
     return now.year if now.month < 10 else now.year + 1
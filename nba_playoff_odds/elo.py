@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import math
+
+# 10 ** (x / 400) == exp(x * ln(10) / 400); exp is much cheaper than generic pow.
+ELO_EXP_SCALE = math.log(10.0) / 400.0
+
 
 def expected_home_win_prob(home_elo: float, away_elo: float, home_court_adv: float = 65.0) -> float:
-    adjusted_home = home_elo + home_court_adv
-    exponent = (away_elo - adjusted_home) / 400.0
-    return 1.0 / (1.0 + 10.0 ** exponent)
+    return 1.0 / (1.0 + math.exp(ELO_EXP_SCALE * (away_elo - home_elo - home_court_adv)))
 
 
 def update_elo(
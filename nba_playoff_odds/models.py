@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TeamStanding:
     season: int
     team_id: int
@@ -19,7 +19,7 @@ class TeamStanding:
         return (self.wins / total) if total else 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameResult:
     game_id: int
     season: int
@@ -33,7 +33,7 @@ class GameResult:
     postseason: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SeededTeam:
     team_id: int
     team_name: str
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import json
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-import pandas as pd
+import numpy as np
+import orjson
 
 from nba_playoff_odds.api import BallDontLieClient
 from nba_playoff_odds.bracket import build_playoff_field
@@ -68,17 +69,14 @@ def parse_standings(raw_rows: list[dict[str, Any]], season: int) -> list[TeamSta
 def parse_games(raw_rows: list[dict[str, Any]], season: int) -> list[GameResult]:
     out: list[GameResult] = []
     for row in raw_rows:
-        if row.get("postseason", False):
+        if row.get("postseason", False) or "final" not in str(row.get("status", "")).lower():
             continue
-        status = str(row.get("status", "")).lower()
-        if "final" not in status:
+        game_date = row.get("date") or row.get("datetime")
+        if not game_date:
             continue
 
         home_team = row.get("home_team") or {}
         away_team = row.get("visitor_team") or row.get("away_team") or {}
-        game_date = row.get("date") or row.get("datetime")
-        if not game_date:
-            continue
 
         out.append(
             GameResult(
@@ -91,7 +89,7 @@ def parse_games(raw_rows: list[dict[str, Any]], season: int) -> list[GameResult]
                 away_team_name=_team_name(away_team),
                 home_score=int(row.get("home_team_score", 0)),
                 away_score=int(row.get("visitor_team_score", row.get("away_team_score", 0))),
-                postseason=bool(row.get("postseason", False)),
+                postseason=False,
             )
         )
     return out
@@ -100,10 +98,7 @@ def parse_games(raw_rows: list[dict[str, Any]], season: int) -> list[GameResult]
 def build_standings_from_games(raw_games: list[dict[str, Any]], season: int) -> list[TeamStanding]:
     team_rows: dict[int, dict[str, Any]] = {}
     for row in raw_games:
-        if row.get("postseason", False):
-            continue
-        status = str(row.get("status", "")).lower()
-        if "final" not in status:
+        if row.get("postseason", False) or "final" not in str(row.get("status", "")).lower():
             continue
 
         home = row.get("home_team") or {}
@@ -152,41 +147,73 @@ def build_standings_from_games(raw_games: list[dict[str, Any]], season: int) ->
     return standings
 
 
-def build_regular_season_ratings(
-    games: list[GameResult],
+def build_ratings_from_columns(
+    games: dict[str, np.ndarray],
     k_factor: float,
     home_court_adv: float,
 ) -> dict[int, float]:
-    ratings: dict[int, float] = {}
-    for game in sorted(games, key=lambda g: (g.game_date, g.game_id)):
-        home_elo = ratings.get(game.home_team_id, 1500.0)
-        away_elo = ratings.get(game.away_team_id, 1500.0)
-        home_won = game.home_score > game.away_score
-        ratings[game.home_team_id], ratings[game.away_team_id] = update_elo(
-            home_elo=home_elo,
-            away_elo=away_elo,
-            home_won=home_won,
+    # Columns must already be in (game_date, game_id) order.
+    n_games = len(games["home_team_id"])
+    if n_games == 0:
+        return {}
+
+    team_ids, team_idx = np.unique(
+        np.concatenate([games["home_team_id"], games["away_team_id"]]),
+        return_inverse=True,
+    )
+    home_idx = team_idx[:n_games].tolist()
+    away_idx = team_idx[n_games:].tolist()
+    home_won = (games["home_score"] > games["away_score"]).tolist()
+
+    # Dense list rather than an ndarray: the replay is sequential, and list
+    # indexing is far cheaper than numpy scalar access in the interpreter.
+    ratings = [1500.0] * len(team_ids)
+    for h, a, won in zip(home_idx, away_idx, home_won):
+        ratings[h], ratings[a] = update_elo(
+            home_elo=ratings[h],
+            away_elo=ratings[a],
+            home_won=won,
             k_factor=k_factor,
             home_court_adv=home_court_adv,
         )
-    return ratings
+    return dict(zip(team_ids.tolist(), ratings))
+
+
+def build_regular_season_ratings(
+    games: list[GameResult],
+    k_factor: float,
+    home_court_adv: float,
+) -> dict[int, float]:
+    ordered = sorted(games, key=lambda g: (g.game_date, g.game_id))
+    columns = {
+        "home_team_id": np.array([g.home_team_id for g in ordered], dtype=np.int64),
+        "away_team_id": np.array([g.away_team_id for g in ordered], dtype=np.int64),
+        "home_score": np.array([g.home_score for g in ordered], dtype=np.int64),
+        "away_score": np.array([g.away_score for g in ordered], dtype=np.int64),
+    }
+    return build_ratings_from_columns(columns, k_factor=k_factor, home_court_adv=home_court_adv)
 
 
 def _write_json(path: Path, payload: list[dict[str, Any]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as fh:
-        json.dump(payload, fh, indent=2)
+    path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
 
 
 def backfill_season(client: BallDontLieClient, storage: DuckDBStorage, settings: Settings, season: int) -> None:
-    ts = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
 
-    games_raw = client.get_regular_season_games(season)
     standings_raw: list[dict[str, Any]] = []
     standings: list[TeamStanding]
 
+    # The endpoints are independent; the client's shared rate limiter keeps the
+    # combined request stream within the configured interval.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        standings_future = pool.submit(client.get_standings, season)
+        games_future = pool.submit(client.get_regular_season_games, season)
+        games_raw = games_future.result()
+
     try:
-        standings_raw = client.get_standings(season)
+        standings_raw = standings_future.result()
         standings = parse_standings(standings_raw, season)
     except RuntimeError as exc:
         if "Unauthorized" in str(exc):
@@ -197,15 +224,19 @@ def backfill_season(client: BallDontLieClient, storage: DuckDBStorage, settings:
         else:
             raise
 
-    storage.insert_bronze_payload("bronze_standings_raw", season=season, payload=standings_raw)
-    storage.insert_bronze_payload("bronze_games_raw", season=season, payload=games_raw)
-
     _write_json(settings.bronze_dir / f"standings_{season}_{ts}.json", standings_raw)
     _write_json(settings.bronze_dir / f"games_{season}_{ts}.json", games_raw)
-
     games = parse_games(games_raw, season)
-    storage.replace_silver_standings(standings)
-    storage.upsert_silver_games(games)
+
+    # The database is only opened once the fetch is done, and released right
+    # after, so dashboard readers are never locked out across API calls.
+    try:
+        storage.insert_bronze_payload("bronze_standings_raw", season=season, payload=standings_raw)
+        storage.insert_bronze_payload("bronze_games_raw", season=season, payload=games_raw)
+        storage.replace_silver_standings(standings)
+        storage.upsert_silver_games(games)
+    finally:
+        storage.close()
 
     logger.info("Backfill complete for season=%s (standings=%s, games=%s)", season, len(standings), len(games))
 
@@ -219,13 +250,20 @@ def run_daily_pipeline(
     k_factor: float,
     home_court_adv: float,
     seed: int = 7,
+    workers: int = 1,
 ) -> None:
     backfill_season(client=client, storage=storage, settings=settings, season=season)
 
-    games = storage.load_silver_games(season)
-    standings = storage.load_silver_standings(season)
+    # Released before the simulation, which can run for a while at high --sims.
+    try:
+        games = storage.load_silver_games_columns(
+            season, ["home_team_id", "away_team_id", "home_score", "away_score"]
+        )
+        standings = storage.load_silver_standings(season)
+    finally:
+        storage.close()
 
-    ratings = build_regular_season_ratings(games=games, k_factor=k_factor, home_court_adv=home_court_adv)
+    ratings = build_ratings_from_columns(games=games, k_factor=k_factor, home_court_adv=home_court_adv)
     field = build_playoff_field(standings)
 
     championship_odds, conference_odds, finals_matchups = run_monte_carlo(
@@ -235,45 +273,26 @@ def run_daily_pipeline(
         k_factor=k_factor,
         home_court_adv=home_court_adv,
         seed=seed,
+        workers=workers,
     )
 
-    run_ts = datetime.utcnow()
-    storage.write_gold_outputs(
-        season=season,
-        run_ts=run_ts,
-        k_factor=k_factor,
-        home_court_adv=home_court_adv,
-        simulations=n_simulations,
-        championship_odds=championship_odds,
-        conference_odds=conference_odds,
-        finals_matchups=finals_matchups,
-    )
-
-    champ_df = pd.DataFrame(
-        [
-            {"team_id": team_id, "team_name": team_name, "championship_odds": prob}
-            for team_id, (team_name, prob) in championship_odds.items()
-        ]
-    ).sort_values("championship_odds", ascending=False)
-    conf_rows: list[dict[str, Any]] = []
-    for conference, items in conference_odds.items():
-        for team_id, (team_name, prob) in items.items():
-            conf_rows.append(
-                {
-                    "conference": conference,
-                    "team_id": team_id,
-                    "team_name": team_name,
-                    "conference_odds": prob,
-                }
-            )
-    conf_df = pd.DataFrame(conf_rows).sort_values(["conference", "conference_odds"], ascending=[True, False])
-    finals_df = pd.DataFrame(
-        [{"matchup": matchup, "probability": prob} for matchup, prob in finals_matchups]
-    )
-
-    champ_df.to_csv(settings.gold_dir / "championship_odds.csv", index=False)
-    conf_df.to_csv(settings.gold_dir / "conference_odds.csv", index=False)
-    finals_df.to_csv(settings.gold_dir / "finals_matchups_top10.csv", index=False)
+    # Naive UTC, matching the TIMESTAMP columns and the last_updated.txt format.
+    run_ts = datetime.now(timezone.utc).replace(tzinfo=None)
+    try:
+        storage.write_gold_outputs(
+            season=season,
+            run_ts=run_ts,
+            k_factor=k_factor,
+            home_court_adv=home_court_adv,
+            simulations=n_simulations,
+            championship_odds=championship_odds,
+            conference_odds=conference_odds,
+            finals_matchups=finals_matchups,
+        )
+        storage.export_gold_csvs(season=season, run_ts=run_ts, output_dir=settings.gold_dir)
+        storage.export_gold_parquet(season=season, output_dir=settings.gold_dir / "parquet")
+    finally:
+        storage.close()
     with (settings.gold_dir / "last_updated.txt").open("w", encoding="utf-8") as fh:
         fh.write(run_ts.isoformat())
 
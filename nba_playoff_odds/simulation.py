@@ -1,11 +1,120 @@
 from __future__ import annotations
 
-import random
-from collections import Counter, defaultdict
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
-from nba_playoff_odds.bracket import simulate_playoffs
+import numpy as np
+
+from nba_playoff_odds.bracket import SCHEDULE_HIGH_HOME, order_playoff_field
+from nba_playoff_odds.elo import ELO_EXP_SCALE
 from nba_playoff_odds.models import SeededTeam
 
+# First-round pairings by seed; slot order matches the bracket halves.
+_FIRST_ROUND_SEEDS = ((1, 8), (4, 5), (2, 7), (3, 6))
+# Fixed shard size keeps results independent of the worker count.
+_SHARD_SIZE = 5_000
+# Series per simulated bracket: 7 per conference plus the Finals.
+_SERIES_PER_SIM = 15
+
+
+def _simulate_series_batch(
+    high: np.ndarray,
+    low: np.ndarray,
+    ratings: np.ndarray,
+    uniforms: np.ndarray,
+    k_factor: float,
+    home_court_adv: float,
+) -> np.ndarray:
+    # One series per simulation row. Ratings are updated in place game by game,
+    # like bracket._simulate_series; games after the series is decided are
+    # drawn but masked out.
+    rows = np.arange(high.shape[0])
+    high_wins = np.zeros(high.shape[0], dtype=np.int8)
+    low_wins = np.zeros(high.shape[0], dtype=np.int8)
+
+    for game, high_is_home in enumerate(SCHEDULE_HIGH_HOME):
+        active = (high_wins < 4) & (low_wins < 4)
+        home, away = (high, low) if high_is_home else (low, high)
+
+        home_elo = ratings[rows, home]
+        away_elo = ratings[rows, away]
+        home_prob = 1.0 / (1.0 + np.exp(ELO_EXP_SCALE * (away_elo - home_elo - home_court_adv)))
+        home_won = uniforms[:, game] < home_prob
+
+        delta = np.where(active, k_factor * (home_won - home_prob), 0.0)
+        ratings[rows, home] = home_elo + delta
+        ratings[rows, away] = away_elo - delta
+
+        high_won = home_won if high_is_home else ~home_won
+        high_wins += active & high_won
+        low_wins += active & ~high_won
+
+    return np.where(high_wins > low_wins, high, low)
+
+
+def _simulate_conference(
+    offset: int,
+    ratings: np.ndarray,
+    uniforms: np.ndarray,
+    k_factor: float,
+    home_court_adv: float,
+) -> np.ndarray:
+    n_sims = ratings.shape[0]
+    first_round = [
+        _simulate_series_batch(
+            np.full(n_sims, offset + high_seed - 1),
+            np.full(n_sims, offset + low_seed - 1),
+            ratings,
+            uniforms[slot],
+            k_factor,
+            home_court_adv,
+        )
+        for slot, (high_seed, low_seed) in enumerate(_FIRST_ROUND_SEEDS)
+    ]
+
+    # Within a conference the team index increases with seed, so the lower
+    # index always holds home court.
+    semis = [
+        _simulate_series_batch(
+            np.minimum(a, b), np.maximum(a, b), ratings, uniforms[slot], k_factor, home_court_adv
+        )
+        for slot, a, b in ((4, first_round[0], first_round[1]), (5, first_round[2], first_round[3]))
+    ]
+    return _simulate_series_batch(
+        np.minimum(*semis), np.maximum(*semis), ratings, uniforms[6], k_factor, home_court_adv
+    )
+
+
+def _simulate_shard(
+    start_ratings: np.ndarray,
+    k_factor: float,
+    home_court_adv: float,
+    n_sims: int,
+    seed_seq: np.random.SeedSequence,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    ratings = np.tile(start_ratings, (n_sims, 1))
+    # Every game of every series is drawn up front in one call: East series
+    # 0-6, West 7-13, Finals 14.
+    uniforms = np.random.default_rng(seed_seq).random(
+        (_SERIES_PER_SIM, n_sims, len(SCHEDULE_HIGH_HOME))
+    )
+
+    east = _simulate_conference(0, ratings, uniforms[:7], k_factor, home_court_adv)
+    west = _simulate_conference(8, ratings, uniforms[7:14], k_factor, home_court_adv)
+
+    rows = np.arange(n_sims)
+    east_has_court = ratings[rows, east] >= ratings[rows, west]
+    champion = _simulate_series_batch(
+        np.where(east_has_court, east, west),
+        np.where(east_has_court, west, east),
+        ratings,
+        uniforms[14],
+        k_factor,
+        home_court_adv,
+    )
+    return champion, east, west
+
 
 def run_monte_carlo(
     playoff_field: dict[str, list[SeededTeam]],
@@ -14,6 +123,7 @@ def run_monte_carlo(
     k_factor: float,
     home_court_adv: float,
     seed: int = 7,
+    workers: int = 1,
 ) -> tuple[
     dict[int, tuple[str, float]],
     dict[str, dict[int, tuple[str, float]]],
@@ -22,43 +132,49 @@ def run_monte_carlo(
     if n_simulations <= 0:
         raise ValueError("n_simulations must be greater than 0")
 
-    team_lookup = {
-        t.team_id: t.team_name
-        for conference in ("East", "West")
-        for t in playoff_field[conference]
-    }
+    teams = order_playoff_field(playoff_field)
+    start_ratings = np.array([base_ratings.get(t.team_id, 1500.0) for t in teams], dtype=np.float64)
 
-    champ_counts: Counter[int] = Counter()
-    conference_counts: dict[str, Counter[int]] = {"East": Counter(), "West": Counter()}
-    finals_counts: Counter[str] = Counter()
-
-    parent_rng = random.Random(seed)
-    for _ in range(n_simulations):
-        sim_rng = random.Random(parent_rng.randint(0, 10**9))
-        sim_ratings = dict(base_ratings)
-        champion, east_champ, west_champ = simulate_playoffs(
-            playoff_field=playoff_field,
-            ratings=sim_ratings,
-            rng=sim_rng,
-            k_factor=k_factor,
-            home_court_adv=home_court_adv,
-        )
+    shard_sizes = [min(_SHARD_SIZE, n_simulations - start) for start in range(0, n_simulations, _SHARD_SIZE)]
+    shard_seeds = np.random.SeedSequence(seed).spawn(len(shard_sizes))
+    run_shard = partial(_simulate_shard, start_ratings, k_factor, home_court_adv)
+    if workers > 1 and len(shard_sizes) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(shard_sizes))) as pool:
+            shards = list(pool.map(run_shard, shard_sizes, shard_seeds))
+    else:
+        shards = list(map(run_shard, shard_sizes, shard_seeds))
+
+    champion, east, west = (np.concatenate(parts) for parts in zip(*shards))
 
-        champ_counts[champion.team_id] += 1
-        conference_counts["East"][east_champ.team_id] += 1
-        conference_counts["West"][west_champ.team_id] += 1
-        finals_counts[f"{east_champ.team_name} vs {west_champ.team_name}"] += 1
+    n_teams = len(teams)
+    champ_counts = np.bincount(champion, minlength=n_teams)
+    conference_counts = {
+        "East": np.bincount(east, minlength=n_teams),
+        "West": np.bincount(west, minlength=n_teams),
+    }
+    # East champions occupy indices 0-7 and West 8-15: one int key per pairing.
+    finals_counts = np.bincount(east * 8 + (west - 8), minlength=64)
 
     championship_odds = {
-        team_id: (team_lookup[team_id], count / n_simulations)
-        for team_id, count in champ_counts.items()
+        teams[i].team_id: (teams[i].team_name, count / n_simulations)
+        for i, count in enumerate(champ_counts.tolist())
+        if count
     }
 
     conference_odds: dict[str, dict[int, tuple[str, float]]] = defaultdict(dict)
-    for conference, counter in conference_counts.items():
+    for conference, counts in conference_counts.items():
         conference_odds[conference] = {
-            team_id: (team_lookup[team_id], count / n_simulations) for team_id, count in counter.items()
+            teams[i].team_id: (teams[i].team_name, count / n_simulations)
+            for i, count in enumerate(counts.tolist())
+            if count
         }
 
-    finals_top_10 = [(matchup, count / n_simulations) for matchup, count in finals_counts.most_common(10)]
+    finals_top_10: list[tuple[str, float]] = []
+    for key in np.argsort(-finals_counts, kind="stable")[:10].tolist():
+        count = int(finals_counts[key])
+        if not count:
+            break
+        east_idx, west_idx = divmod(key, 8)
+        matchup = f"{teams[east_idx].team_name} vs {teams[8 + west_idx].team_name}"
+        finals_top_10.append((matchup, count / n_simulations))
     return championship_odds, conference_odds, finals_top_10
@@ -1,132 +1,238 @@
 from __future__ import annotations
 
-import json
-from datetime import datetime
+from collections.abc import Sequence
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 import duckdb
+import numpy as np
+import orjson
+import pyarrow as pa
 
 from nba_playoff_odds.models import GameResult, TeamStanding
 
+_SCHEMA_SQL = """
+BEGIN TRANSACTION;
+
+CREATE TABLE IF NOT EXISTS bronze_standings_raw (
+    season INTEGER,
+    fetched_at TIMESTAMP,
+    payload JSON
+);
+
+CREATE TABLE IF NOT EXISTS bronze_games_raw (
+    season INTEGER,
+    fetched_at TIMESTAMP,
+    payload JSON
+);
+
+CREATE TABLE IF NOT EXISTS silver_games (
+    game_id BIGINT PRIMARY KEY,
+    season INTEGER,
+    game_date TIMESTAMP,
+    home_team_id INTEGER,
+    home_team_name VARCHAR,
+    away_team_id INTEGER,
+    away_team_name VARCHAR,
+    home_score INTEGER,
+    away_score INTEGER,
+    postseason BOOLEAN
+);
+
+CREATE TABLE IF NOT EXISTS silver_standings (
+    season INTEGER,
+    team_id INTEGER,
+    team_name VARCHAR,
+    conference VARCHAR,
+    wins INTEGER,
+    losses INTEGER,
+    win_pct DOUBLE,
+    PRIMARY KEY (season, team_id)
+);
+
+CREATE TABLE IF NOT EXISTS gold_championship_odds (
+    season INTEGER,
+    team_id INTEGER,
+    team_name VARCHAR,
+    championship_odds DOUBLE,
+    simulations INTEGER,
+    run_ts TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS gold_conference_odds (
+    season INTEGER,
+    conference VARCHAR,
+    team_id INTEGER,
+    team_name VARCHAR,
+    conference_odds DOUBLE,
+    simulations INTEGER,
+    run_ts TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS gold_finals_matchups (
+    season INTEGER,
+    matchup VARCHAR,
+    probability DOUBLE,
+    simulations INTEGER,
+    run_ts TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS gold_runs (
+    season INTEGER,
+    run_ts TIMESTAMP,
+    k_factor DOUBLE,
+    home_court_adv DOUBLE,
+    simulations INTEGER
+);
+
+COMMIT;
+"""
+
+_SILVER_GAMES_SCHEMA = pa.schema(
+    [
+        ("game_id", pa.int64()),
+        ("season", pa.int32()),
+        ("game_date", pa.timestamp("us")),
+        ("home_team_id", pa.int32()),
+        ("home_team_name", pa.string()),
+        ("away_team_id", pa.int32()),
+        ("away_team_name", pa.string()),
+        ("home_score", pa.int32()),
+        ("away_score", pa.int32()),
+        ("postseason", pa.bool_()),
+    ]
+)
+_SILVER_STANDINGS_SCHEMA = pa.schema(
+    [
+        ("season", pa.int32()),
+        ("team_id", pa.int32()),
+        ("team_name", pa.string()),
+        ("conference", pa.string()),
+        ("wins", pa.int32()),
+        ("losses", pa.int32()),
+        ("win_pct", pa.float64()),
+    ]
+)
+_GOLD_CHAMPIONSHIP_SCHEMA = pa.schema(
+    [
+        ("season", pa.int32()),
+        ("team_id", pa.int32()),
+        ("team_name", pa.string()),
+        ("championship_odds", pa.float64()),
+        ("simulations", pa.int32()),
+        ("run_ts", pa.timestamp("us")),
+    ]
+)
+_GOLD_CONFERENCE_SCHEMA = pa.schema(
+    [
+        ("season", pa.int32()),
+        ("conference", pa.string()),
+        ("team_id", pa.int32()),
+        ("team_name", pa.string()),
+        ("conference_odds", pa.float64()),
+        ("simulations", pa.int32()),
+        ("run_ts", pa.timestamp("us")),
+    ]
+)
+_GOLD_FINALS_SCHEMA = pa.schema(
+    [
+        ("season", pa.int32()),
+        ("matchup", pa.string()),
+        ("probability", pa.float64()),
+        ("simulations", pa.int32()),
+        ("run_ts", pa.timestamp("us")),
+    ]
+)
+
+
+def _arrow_rows(schema: pa.Schema, rows: list[tuple[Any, ...]]) -> pa.Table:
+    columns = list(zip(*rows)) if rows else [() for _ in schema]
+    return pa.Table.from_arrays(
+        [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+        schema=schema,
+    )
+
+
+def _gold_table(schema: pa.Schema, constants: dict[str, Any], columns: dict[str, list[Any]]) -> pa.Table:
+    # Per-run values (season, simulations, run_ts) are broadcast to every row.
+    n_rows = len(next(iter(columns.values())))
+    return pa.Table.from_arrays(
+        [
+            pa.repeat(pa.scalar(constants[field.name], type=field.type), n_rows)
+            if field.name in constants
+            else pa.array(columns[field.name], type=field.type)
+            for field in schema
+        ],
+        schema=schema,
+    )
+
+
+def _insert_arrow(con: duckdb.DuckDBPyConnection, sql: str, rows: pa.Table) -> None:
+    # The statement reads from the registered view "arrow_rows"; DuckDB scans the
+    # Arrow buffers directly instead of binding one prepared statement per row.
+    con.register("arrow_rows", rows)
+    try:
+        con.execute(sql)
+    finally:
+        con.unregister("arrow_rows")
+
 
 class DuckDBStorage:
     def __init__(self, db_path: Path) -> None:
         self.db_path = db_path
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init_schema()
+        if not self.db_path.parent.is_dir():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._con: duckdb.DuckDBPyConnection | None = None
+        self._schema_ready = False
 
-    def _connect(self) -> duckdb.DuckDBPyConnection:
-        return duckdb.connect(str(self.db_path))
+    def __enter__(self) -> DuckDBStorage:
+        return self
 
-    def _init_schema(self) -> None:
-        with self._connect() as con:
-            con.execute(
-                """
-                CREATE TABLE IF NOT EXISTS bronze_standings_raw (
-                    season INTEGER,
-                    fetched_at TIMESTAMP,
-                    payload JSON
-                );
-                """
-            )
-            con.execute(
-                """
-                CREATE TABLE IF NOT EXISTS bronze_games_raw (
-                    season INTEGER,
-                    fetched_at TIMESTAMP,
-                    payload JSON
-                );
-                """
-            )
-            con.execute(
-                """
-                CREATE TABLE IF NOT EXISTS silver_games (
-                    game_id BIGINT PRIMARY KEY,
-                    season INTEGER,
-                    game_date TIMESTAMP,
-                    home_team_id INTEGER,
-                    home_team_name VARCHAR,
-                    away_team_id INTEGER,
-                    away_team_name VARCHAR,
-                    home_score INTEGER,
-                    away_score INTEGER,
-                    postseason BOOLEAN
-                );
-                """
-            )
-            con.execute(
-                """
-                CREATE TABLE IF NOT EXISTS silver_standings (
-                    season INTEGER,
-                    team_id INTEGER,
-                    team_name VARCHAR,
-                    conference VARCHAR,
-                    wins INTEGER,
-                    losses INTEGER,
-                    win_pct DOUBLE,
-                    PRIMARY KEY (season, team_id)
-                );
-                """
-            )
-            con.execute(
-                """
-                CREATE TABLE IF NOT EXISTS gold_championship_odds (
-                    season INTEGER,
-                    team_id INTEGER,
-                    team_name VARCHAR,
-                    championship_odds DOUBLE,
-                    simulations INTEGER,
-                    run_ts TIMESTAMP
-                );
-                """
-            )
-            con.execute(
-                """
-                CREATE TABLE IF NOT EXISTS gold_conference_odds (
-                    season INTEGER,
-                    conference VARCHAR,
-                    team_id INTEGER,
-                    team_name VARCHAR,
-                    conference_odds DOUBLE,
-                    simulations INTEGER,
-                    run_ts TIMESTAMP
-                );
-                """
-            )
-            con.execute(
-                """
-                CREATE TABLE IF NOT EXISTS gold_finals_matchups (
-                    season INTEGER,
-                    matchup VARCHAR,
-                    probability DOUBLE,
-                    simulations INTEGER,
-                    run_ts TIMESTAMP
-                );
-                """
-            )
-            con.execute(
-                """
-                CREATE TABLE IF NOT EXISTS gold_runs (
-                    season INTEGER,
-                    run_ts TIMESTAMP,
-                    k_factor DOUBLE,
-                    home_court_adv DOUBLE,
-                    simulations INTEGER
-                );
-                """
-            )
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        # Releases the file lock; the next storage call reopens the database.
+        if self._con is not None:
+            self._con.close()
+            self._con = None
+
+    def _connect(self) -> duckdb.DuckDBPyConnection:
+        # The database is opened on first use, not at construction, so an idle
+        # storage object never holds the write lock that would block read-only
+        # readers such as the dashboard. Each call gets its own cursor on the
+        # handle, which the caller's with-block closes.
+        if self._con is None:
+            con = duckdb.connect(str(self.db_path))
+            if not self._schema_ready:
+                try:
+                    con.execute(_SCHEMA_SQL)
+                except Exception:
+                    con.close()
+                    raise
+                self._schema_ready = True
+            self._con = con
+        return self._con.cursor()
 
     def insert_bronze_payload(self, table: str, season: int, payload: list[dict[str, Any]]) -> None:
         if table not in {"bronze_standings_raw", "bronze_games_raw"}:
             raise ValueError(f"Unsupported bronze table: {table}")
+        # TIMESTAMP columns hold naive UTC; an aware value would be shifted to the
+        # session time zone on bind.
+        fetched_at = datetime.now(timezone.utc).replace(tzinfo=None)
         with self._connect() as con:
             con.execute(
                 f"INSERT INTO {table}(season, fetched_at, payload) VALUES (?, ?, ?)",
-                [season, datetime.utcnow(), json.dumps(payload)],
+                [season, fetched_at, orjson.dumps(payload).decode()],
             )
 
     def upsert_silver_games(self, games: list[GameResult]) -> None:
+        # MERGE rejects a batch that names the same game twice; keep the last
+        # occurrence, which is what row-by-row INSERT OR REPLACE ended up storing.
+        unique: dict[int, GameResult] = {}
+        for g in games:
+            unique[g.game_id] = g
         rows = [
             (
                 g.game_id,
@@ -140,43 +246,85 @@ class DuckDBStorage:
                 g.away_score,
                 g.postseason,
             )
-            for g in games
+            for g in unique.values()
         ]
+        # Finished games come back unchanged on every daily run; only rows that
+        # differ are rewritten.
         with self._connect() as con:
-            con.executemany(
+            _insert_arrow(
+                con,
                 """
-                INSERT OR REPLACE INTO silver_games(
+                MERGE INTO silver_games AS t
+                USING arrow_rows AS s
+                ON t.game_id = s.game_id
+                WHEN MATCHED AND (
+                    t.season IS DISTINCT FROM s.season
+                    OR t.game_date IS DISTINCT FROM s.game_date
+                    OR t.home_team_id IS DISTINCT FROM s.home_team_id
+                    OR t.home_team_name IS DISTINCT FROM s.home_team_name
+                    OR t.away_team_id IS DISTINCT FROM s.away_team_id
+                    OR t.away_team_name IS DISTINCT FROM s.away_team_name
+                    OR t.home_score IS DISTINCT FROM s.home_score
+                    OR t.away_score IS DISTINCT FROM s.away_score
+                    OR t.postseason IS DISTINCT FROM s.postseason
+                ) THEN UPDATE SET
+                    season = s.season,
+                    game_date = s.game_date,
+                    home_team_id = s.home_team_id,
+                    home_team_name = s.home_team_name,
+                    away_team_id = s.away_team_id,
+                    away_team_name = s.away_team_name,
+                    home_score = s.home_score,
+                    away_score = s.away_score,
+                    postseason = s.postseason
+                WHEN NOT MATCHED THEN INSERT (
                     game_id, season, game_date, home_team_id, home_team_name,
                     away_team_id, away_team_name, home_score, away_score, postseason
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ) VALUES (
+                    s.game_id, s.season, s.game_date, s.home_team_id, s.home_team_name,
+                    s.away_team_id, s.away_team_name, s.home_score, s.away_score, s.postseason
+                )
                 """,
-                rows,
+                _arrow_rows(_SILVER_GAMES_SCHEMA, rows),
             )
 
     def replace_silver_standings(self, standings: list[TeamStanding]) -> None:
         if not standings:
             return
         season = standings[0].season
+        rows = _arrow_rows(
+            _SILVER_STANDINGS_SCHEMA,
+            [(s.season, s.team_id, s.team_name, s.conference, s.wins, s.losses, s.win_pct) for s in standings],
+        )
+        with self._connect() as con:
+            con.begin()
+            try:
+                con.execute("DELETE FROM silver_standings WHERE season = ?", [season])
+                _insert_arrow(
+                    con,
+                    """
+                    INSERT INTO silver_standings(season, team_id, team_name, conference, wins, losses, win_pct)
+                    SELECT * FROM arrow_rows
+                    """,
+                    rows,
+                )
+                con.commit()
+            except Exception:
+                con.rollback()
+                raise
+
+    def load_silver_games_arrow(self, season: int) -> pa.Table:
         with self._connect() as con:
-            con.execute("DELETE FROM silver_standings WHERE season = ?", [season])
-            con.executemany(
+            return con.execute(
                 """
-                INSERT INTO silver_standings(season, team_id, team_name, conference, wins, losses, win_pct)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
+                SELECT game_id, season, game_date, home_team_id, home_team_name,
+                       away_team_id, away_team_name, home_score, away_score, postseason
+                FROM silver_games
+                WHERE season = ?
+                ORDER BY game_date, game_id
                 """,
-                [
-                    (
-                        s.season,
-                        s.team_id,
-                        s.team_name,
-                        s.conference,
-                        s.wins,
-                        s.losses,
-                        s.win_pct,
-                    )
-                    for s in standings
-                ],
-            )
+                [season],
+            ).to_arrow_table()
 
     def load_silver_games(self, season: int) -> list[GameResult]:
         with self._connect() as con:
@@ -206,6 +354,23 @@ class DuckDBStorage:
             for r in rows
         ]
 
+    def load_silver_games_columns(self, season: int, columns: Sequence[str]) -> dict[str, np.ndarray]:
+        if not columns:
+            raise ValueError("At least one silver_games column is required")
+        unknown = set(columns) - set(_SILVER_GAMES_SCHEMA.names)
+        if unknown:
+            raise ValueError(f"Unsupported silver_games columns: {sorted(unknown)}")
+        with self._connect() as con:
+            return con.execute(
+                f"""
+                SELECT {", ".join(columns)}
+                FROM silver_games
+                WHERE season = ?
+                ORDER BY game_date, game_id
+                """,
+                [season],
+            ).fetchnumpy()
+
     def load_silver_standings(self, season: int) -> list[TeamStanding]:
         with self._connect() as con:
             rows = con.execute(
@@ -239,48 +404,124 @@ class DuckDBStorage:
         conference_odds: dict[str, dict[int, tuple[str, float]]],
         finals_matchups: list[tuple[str, float]],
     ) -> None:
-        with self._connect() as con:
-            con.execute("DELETE FROM gold_championship_odds WHERE season = ?", [season])
-            con.execute("DELETE FROM gold_conference_odds WHERE season = ?", [season])
-            con.execute("DELETE FROM gold_finals_matchups WHERE season = ?", [season])
-            con.execute("DELETE FROM gold_runs WHERE season = ?", [season])
+        run_constants = {"season": season, "simulations": simulations, "run_ts": run_ts}
+        championship_rows = _gold_table(
+            _GOLD_CHAMPIONSHIP_SCHEMA,
+            run_constants,
+            {
+                "team_id": list(championship_odds),
+                "team_name": [team_name for team_name, _ in championship_odds.values()],
+                "championship_odds": [prob for _, prob in championship_odds.values()],
+            },
+        )
 
-            con.executemany(
-                """
-                INSERT INTO gold_championship_odds(season, team_id, team_name, championship_odds, simulations, run_ts)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                [
-                    (season, team_id, team_name, prob, simulations, run_ts)
-                    for team_id, (team_name, prob) in championship_odds.items()
-                ],
-            )
+        conference_columns: dict[str, list[Any]] = {
+            "conference": [],
+            "team_id": [],
+            "team_name": [],
+            "conference_odds": [],
+        }
+        for conference, team_probs in conference_odds.items():
+            conference_columns["conference"].extend([conference] * len(team_probs))
+            conference_columns["team_id"].extend(team_probs)
+            conference_columns["team_name"].extend(team_name for team_name, _ in team_probs.values())
+            conference_columns["conference_odds"].extend(prob for _, prob in team_probs.values())
+        conference_rows = _gold_table(_GOLD_CONFERENCE_SCHEMA, run_constants, conference_columns)
 
-            conference_rows: list[tuple[Any, ...]] = []
-            for conference, team_probs in conference_odds.items():
-                for team_id, (team_name, prob) in team_probs.items():
-                    conference_rows.append((season, conference, team_id, team_name, prob, simulations, run_ts))
-            con.executemany(
-                """
-                INSERT INTO gold_conference_odds(
-                    season, conference, team_id, team_name, conference_odds, simulations, run_ts
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                conference_rows,
-            )
+        finals_rows = _gold_table(
+            _GOLD_FINALS_SCHEMA,
+            run_constants,
+            {
+                "matchup": [matchup for matchup, _ in finals_matchups],
+                "probability": [prob for _, prob in finals_matchups],
+            },
+        )
 
-            con.executemany(
-                """
-                INSERT INTO gold_finals_matchups(season, matchup, probability, simulations, run_ts)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                [(season, matchup, prob, simulations, run_ts) for matchup, prob in finals_matchups],
-            )
+        # One transaction per run: readers never see a season half-replaced, and a
+        # failed insert leaves the previous run's rows in place.
+        with self._connect() as con:
+            con.begin()
+            try:
+                con.execute("DELETE FROM gold_championship_odds WHERE season = ?", [season])
+                con.execute("DELETE FROM gold_conference_odds WHERE season = ?", [season])
+                con.execute("DELETE FROM gold_finals_matchups WHERE season = ?", [season])
+                con.execute("DELETE FROM gold_runs WHERE season = ?", [season])
 
-            con.execute(
-                """
-                INSERT INTO gold_runs(season, run_ts, k_factor, home_court_adv, simulations)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                [season, run_ts, k_factor, home_court_adv, simulations],
-            )
+                _insert_arrow(
+                    con,
+                    """
+                    INSERT INTO gold_championship_odds(season, team_id, team_name, championship_odds, simulations, run_ts)
+                    SELECT * FROM arrow_rows
+                    """,
+                    championship_rows,
+                )
+                _insert_arrow(
+                    con,
+                    """
+                    INSERT INTO gold_conference_odds(
+                        season, conference, team_id, team_name, conference_odds, simulations, run_ts
+                    ) SELECT * FROM arrow_rows
+                    """,
+                    conference_rows,
+                )
+                _insert_arrow(
+                    con,
+                    """
+                    INSERT INTO gold_finals_matchups(season, matchup, probability, simulations, run_ts)
+                    SELECT * FROM arrow_rows
+                    """,
+                    finals_rows,
+                )
+                con.execute(
+                    """
+                    INSERT INTO gold_runs(season, run_ts, k_factor, home_court_adv, simulations)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    [season, run_ts, k_factor, home_court_adv, simulations],
+                )
+                con.commit()
+            except Exception:
+                con.rollback()
+                raise
+
+    def export_gold_csvs(self, season: int, run_ts: datetime, output_dir: Path) -> None:
+        exports = {
+            "championship_odds.csv": """
+                SELECT team_id, team_name, championship_odds
+                FROM gold_championship_odds
+                WHERE season = ? AND run_ts = ?
+                ORDER BY championship_odds DESC
+            """,
+            "conference_odds.csv": """
+                SELECT conference, team_id, team_name, conference_odds
+                FROM gold_conference_odds
+                WHERE season = ? AND run_ts = ?
+                ORDER BY conference, conference_odds DESC
+            """,
+            "finals_matchups_top10.csv": """
+                SELECT matchup, probability
+                FROM gold_finals_matchups
+                WHERE season = ? AND run_ts = ?
+                ORDER BY probability DESC
+            """,
+        }
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with self._connect() as con:
+            for filename, query in exports.items():
+                target = str(output_dir / filename).replace("'", "''")
+                con.execute(f"COPY ({query}) TO '{target}' (HEADER, DELIMITER ',')", [season, run_ts])
+
+    def export_gold_parquet(self, season: int, output_dir: Path) -> None:
+        # One directory per gold table, Hive-partitioned by season. Rewriting a
+        # season replaces its data_0.parquet and leaves other seasons untouched.
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with self._connect() as con:
+            for table in ("gold_championship_odds", "gold_conference_odds", "gold_finals_matchups"):
+                target = str(output_dir / table.removeprefix("gold_")).replace("'", "''")
+                con.execute(
+                    f"""
+                    COPY (SELECT * FROM {table} WHERE season = ?)
+                    TO '{target}' (FORMAT PARQUET, PARTITION_BY (season), OVERWRITE_OR_IGNORE)
+                    """,
+                    [season],
+                )
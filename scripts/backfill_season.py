@@ -1,12 +1,8 @@
 from __future__ import annotations
 
 import argparse
-import sys
 
-from nba_playoff_odds.api import BallDontLieClient
-from nba_playoff_odds.config import configure_logging, load_settings
-from nba_playoff_odds.pipeline import backfill_season
-from nba_playoff_odds.storage import DuckDBStorage
+from cli import main
 
 
 def parse_args() -> argparse.Namespace:
@@ -15,23 +11,5 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def main() -> int:
-    configure_logging()
-    settings = load_settings()
-    args = parse_args()
-
-    try:
-        client = BallDontLieClient(
-            base_url=settings.api_base_url,
-            min_request_interval_seconds=settings.min_request_interval_seconds,
-        )
-        storage = DuckDBStorage(db_path=settings.db_path)
-        backfill_season(client=client, storage=storage, settings=settings, season=args.season)
-    except Exception as exc:
-        print(f"ERROR: {exc}", file=sys.stderr)
-        return 1
-    return 0
-
-
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(main(["backfill", "--seasons", str(parse_args().season)]))
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import argparse
+import sys
+
+from nba_playoff_odds.api import BallDontLieClient
+from nba_playoff_odds.config import configure_logging, infer_season, load_settings
+from nba_playoff_odds.pipeline import backfill_season, run_daily_pipeline
+from nba_playoff_odds.storage import DuckDBStorage
+
+
+def parse_seasons(value: str) -> list[int]:
+    seasons: list[int] = []
+    for part in value.split(","):
+        start, sep, end = part.strip().partition("-")
+        try:
+            first = int(start)
+            last = int(end) if sep else first
+        except ValueError as exc:
+            raise argparse.ArgumentTypeError(f"invalid season or range: {part!r}") from exc
+        if last < first:
+            raise argparse.ArgumentTypeError(f"season range runs backwards: {part!r}")
+        seasons.extend(range(first, last + 1))
+    return seasons
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="NBA playoff odds pipeline")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    seasons_help = "Seasons, e.g. 2025, 2018-2024 or 2019,2021"
+
+    backfill = subparsers.add_parser("backfill", help="Backfill games + standings into bronze/silver")
+    backfill.add_argument("--seasons", type=parse_seasons, required=True, help=seasons_help)
+
+    daily = subparsers.add_parser("daily", help="Run the full daily pipeline")
+    daily.add_argument(
+        "--seasons", "--season", type=parse_seasons, default=None, help=f"{seasons_help} (default inferred)"
+    )
+    daily.add_argument("--sims", type=int, default=None, help="Number of Monte Carlo simulations")
+    daily.add_argument("--k-factor", type=float, default=None, help="Elo K-factor")
+    daily.add_argument("--home-adv", type=float, default=None, help="Home-court Elo adjustment")
+    daily.add_argument("--seed", type=int, default=7, help="Monte Carlo RNG seed")
+    daily.add_argument("--workers", type=int, default=None, help="Processes used for Monte Carlo shards")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    configure_logging()
+    settings = load_settings()
+    args = parse_args(argv)
+
+    try:
+        client = BallDontLieClient(
+            base_url=settings.api_base_url,
+            min_request_interval_seconds=settings.min_request_interval_seconds,
+            cache_dir=settings.http_cache_dir,
+            cache_ttl_seconds=settings.http_cache_ttl_seconds,
+        )
+        # One client for every season, so its rate limiter and HTTP cache are
+        # shared. The pipeline releases the database lock after each season's
+        # write phases; it is never held while pages are being fetched.
+        with DuckDBStorage(db_path=settings.db_path) as storage:
+            if args.command == "backfill":
+                for season in args.seasons:
+                    backfill_season(client=client, storage=storage, settings=settings, season=season)
+            else:
+                sims = args.sims if args.sims is not None else settings.default_simulations
+                k_factor = args.k_factor if args.k_factor is not None else settings.default_k_factor
+                home_adv = args.home_adv if args.home_adv is not None else settings.default_home_court_adv
+                workers = args.workers if args.workers is not None else settings.default_workers
+                for season in args.seasons or [infer_season()]:
+                    run_daily_pipeline(
+                        client=client,
+                        storage=storage,
+                        settings=settings,
+                        season=season,
+                        n_simulations=sims,
+                        k_factor=k_factor,
+                        home_court_adv=home_adv,
+                        seed=args.seed,
+                        workers=workers,
+                    )
+    except Exception as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,87 @@
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+import requests
+
+from nba_playoff_odds.api import BallDontLieClient
+
+BASE_URL = "https://api.example.test/v1"
+PARAMS = {"season": 2025, "per_page": 100}
+CACHED_PAYLOAD = {"data": [{"id": 1}], "meta": {}}
+
+
+def _response(status_code: int, body: Any = None, headers: dict[str, str] | None = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = f"{BASE_URL}/standings"
+    response._content = json.dumps(body).encode("utf-8") if body is not None else b""
+    response.headers.update(headers or {})
+    return response
+
+
+class _StubGet:
+    def __init__(self, *responses: requests.Response) -> None:
+        self.responses = list(responses)
+        self.calls: list[dict[str, str]] = []
+
+    def __call__(self, url: str, params: dict[str, Any], headers: dict[str, str], timeout: int) -> requests.Response:
+        self.calls.append(dict(headers))
+        return self.responses.pop(0)
+
+
+def _client(tmp_path: Path, stub: _StubGet, max_retries: int = 5) -> BallDontLieClient:
+    client = BallDontLieClient(
+        base_url=BASE_URL,
+        api_key="test",
+        max_retries=max_retries,
+        cache_dir=tmp_path,
+        cache_ttl_seconds=60.0,
+    )
+    client.session.get = stub
+    return client
+
+
+def _seed_cache(client: BallDontLieClient, fetched_at: float) -> Path:
+    path = client._cache_path(f"{BASE_URL}/standings", PARAMS)
+    entry = {"fetched_at": fetched_at, "etag": '"v1"', "last_modified": None, "payload": CACHED_PAYLOAD}
+    client._write_cache(path, entry)
+    return path
+
+
+def test_fresh_cache_entry_skips_request_and_rate_limit_slot(tmp_path: Path) -> None:
+    stub = _StubGet()
+    client = _client(tmp_path, stub)
+    _seed_cache(client, fetched_at=time.time())
+
+    assert client._request("standings", PARAMS) == CACHED_PAYLOAD
+    assert stub.calls == []
+    assert client._last_request_ts == 0.0
+
+
+def test_expired_cache_entry_revalidates_with_etag(tmp_path: Path) -> None:
+    stub = _StubGet(_response(304))
+    client = _client(tmp_path, stub)
+    path = _seed_cache(client, fetched_at=time.time() - 3600)
+
+    assert client._request("standings", PARAMS) == CACHED_PAYLOAD
+    assert stub.calls == [{"If-None-Match": '"v1"'}]
+    assert time.time() - json.loads(path.read_text())["fetched_at"] < 60.0
+
+
+@pytest.mark.parametrize(("status_code", "expected_calls"), [(429, 2), (500, 1)])
+def test_failed_request_leaves_cache_untouched(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, status_code: int, expected_calls: int
+) -> None:
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    stub = _StubGet(_response(status_code, {"error": "nope"}), _response(status_code, {"error": "nope"}))
+    client = _client(tmp_path, stub, max_retries=2)
+    path = _seed_cache(client, fetched_at=time.time() - 3600)
+    before = path.read_bytes()
+
+    with pytest.raises(RuntimeError):
+        client._request("standings", PARAMS)
+    assert len(stub.calls) == expected_calls
+    assert path.read_bytes() == before
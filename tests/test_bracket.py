@@ -1,10 +1,17 @@
 import random
+from math import comb
 
+import numpy as np
+import pytest
+
+from nba_playoff_odds import bracket
+from nba_playoff_odds.elo import expected_home_win_prob
 from nba_playoff_odds.models import SeededTeam
-from nba_playoff_odds.simulation import run_monte_carlo
+from nba_playoff_odds.simulation import _SERIES_PER_SIM, _simulate_series_batch, _simulate_shard, run_monte_carlo
 
 
-def _playoff_field() -> dict[str, list[SeededTeam]]:
+@pytest.fixture(scope="module")
+def field() -> dict[str, list[SeededTeam]]:
     return {
         "East": [
             SeededTeam(team_id=100 + seed, team_name=f"East {seed}", conference="East", seed=seed)
@@ -17,7 +24,8 @@ def _playoff_field() -> dict[str, list[SeededTeam]]:
     }
 
 
-def _ratings() -> dict[int, float]:
+@pytest.fixture(scope="module")
+def ratings() -> dict[int, float]:
     rng = random.Random(42)
     ratings: dict[int, float] = {}
     for team_id in list(range(101, 109)) + list(range(201, 209)):
@@ -25,11 +33,32 @@ def _ratings() -> dict[int, float]:
     return ratings
 
 
-def test_monte_carlo_is_deterministic_with_seed() -> None:
-    field = _playoff_field()
-    ratings = _ratings()
+# Championship wins out of 300 simulations for seed=123. Any change to the draw
+# order, bracket pairing or in-series Elo updates moves these counts.
+_EXPECTED_TITLES_SEED_123 = {
+    101: 30,
+    102: 3,
+    103: 13,
+    104: 8,
+    105: 42,
+    106: 31,
+    107: 62,
+    108: 4,
+    201: 16,
+    202: 4,
+    203: 6,
+    204: 23,
+    205: 1,
+    206: 6,
+    207: 29,
+    208: 22,
+}
 
-    out_1 = run_monte_carlo(
+
+def test_monte_carlo_matches_seeded_snapshot(
+    field: dict[str, list[SeededTeam]], ratings: dict[int, float]
+) -> None:
+    championship_odds, _, _ = run_monte_carlo(
         playoff_field=field,
         base_ratings=ratings,
         n_simulations=300,
@@ -37,13 +66,126 @@ def test_monte_carlo_is_deterministic_with_seed() -> None:
         home_court_adv=65,
         seed=123,
     )
+
+    titles = {team_id: round(prob * 300) for team_id, (_, prob) in championship_odds.items()}
+    assert titles == _EXPECTED_TITLES_SEED_123
+
+
+def test_monte_carlo_is_deterministic_with_seed(
+    field: dict[str, list[SeededTeam]], ratings: dict[int, float]
+) -> None:
+    out_1 = run_monte_carlo(
+        playoff_field=field,
+        base_ratings=ratings,
+        n_simulations=10,
+        k_factor=20,
+        home_court_adv=65,
+        seed=123,
+    )
     out_2 = run_monte_carlo(
         playoff_field=field,
         base_ratings=ratings,
-        n_simulations=300,
+        n_simulations=10,
         k_factor=20,
         home_court_adv=65,
         seed=123,
     )
 
     assert out_1 == out_2
+
+
+def test_monte_carlo_results_do_not_depend_on_worker_count(
+    field: dict[str, list[SeededTeam]], ratings: dict[int, float]
+) -> None:
+    serial = run_monte_carlo(
+        playoff_field=field,
+        base_ratings=ratings,
+        n_simulations=6000,
+        k_factor=20,
+        home_court_adv=65,
+        seed=123,
+    )
+    parallel = run_monte_carlo(
+        playoff_field=field,
+        base_ratings=ratings,
+        n_simulations=6000,
+        k_factor=20,
+        home_court_adv=65,
+        seed=123,
+        workers=2,
+    )
+
+    assert serial == parallel
+
+
+def _best_of_seven_prob(p_home: float, p_away: float) -> float:
+    # The higher seed hosts 4 of 7 games; with independent games, taking the
+    # series is the same event as winning at least 4 of all 7.
+    return sum(
+        comb(4, h) * p_home**h * (1 - p_home) ** (4 - h) * comb(3, a) * p_away**a * (1 - p_away) ** (3 - a)
+        for h in range(5)
+        for a in range(4)
+        if h + a >= 4
+    )
+
+
+def test_series_simulator_matches_closed_form_without_elo_updates() -> None:
+    n_sims = 200_000
+    ratings = np.tile([1560.0, 1490.0], (n_sims, 1))
+    winners = _simulate_series_batch(
+        np.zeros(n_sims, dtype=np.int64),
+        np.ones(n_sims, dtype=np.int64),
+        ratings,
+        np.random.default_rng(11).random((n_sims, 7)),
+        k_factor=0.0,
+        home_court_adv=65.0,
+    )
+
+    expected = _best_of_seven_prob(
+        expected_home_win_prob(1560.0, 1490.0, 65.0),
+        1.0 - expected_home_win_prob(1490.0, 1560.0, 65.0),
+    )
+    observed = float(np.mean(winners == 0))
+    assert abs(observed - expected) < 4 * np.sqrt(expected * (1 - expected) / n_sims)
+
+
+class _SeriesUniforms:
+    # Stands in for random.Random: each series reads the next row of draws,
+    # the same row the vectorised simulator gives that series.
+    def __init__(self, draws: np.ndarray) -> None:
+        self.draws = iter(draws)
+        self.games = iter(())
+
+    def next_series(self) -> None:
+        self.games = iter(next(self.draws).tolist())
+
+    def random(self) -> float:
+        return next(self.games)
+
+
+def test_scalar_bracket_matches_vectorised_simulator(
+    field: dict[str, list[SeededTeam]], ratings: dict[int, float], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    n_sims = 2000
+    teams = bracket.order_playoff_field(field)
+    start_ratings = np.array([ratings[t.team_id] for t in teams])
+    seed_seq = np.random.SeedSequence(5)
+    draws = np.random.default_rng(seed_seq).random((_SERIES_PER_SIM, n_sims, 7))
+    champion, east, west = _simulate_shard(start_ratings, 20.0, 65.0, n_sims, seed_seq)
+
+    simulate_series = bracket._simulate_series
+
+    def next_series_then_simulate(*args: object) -> int:
+        args[3].next_series()
+        return simulate_series(*args)
+
+    monkeypatch.setattr(bracket, "_simulate_series", next_series_then_simulate)
+
+    for row in range(n_sims):
+        run_ratings = {**ratings, 999: 1500.0}
+        result = bracket.simulate_playoffs(field, run_ratings, _SeriesUniforms(draws[:, row]), 20.0, 65.0)
+
+        assert result == (teams[champion[row]], teams[east[row]], teams[west[row]])
+        assert run_ratings[999] == 1500.0
+        assert all(run_ratings[t.team_id] != ratings[t.team_id] for t in teams)
+        assert sum(run_ratings[t.team_id] for t in teams) == pytest.approx(sum(start_ratings))
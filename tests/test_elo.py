@@ -1,4 +1,11 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
 from nba_playoff_odds.elo import expected_home_win_prob, update_elo
+from nba_playoff_odds.models import GameResult
+from nba_playoff_odds.pipeline import build_ratings_from_columns, build_regular_season_ratings
 
 
 def test_expected_home_win_probability_has_home_edge() -> None:
@@ -15,3 +22,35 @@ def test_elo_update_conserves_total_rating() -> None:
         home_court_adv=65,
     )
     assert round(new_home + new_away, 8) == 3000.0
+
+
+def test_replayed_ratings_match_hand_folded_elo() -> None:
+    start = datetime(2024, 10, 22)
+    games = [
+        GameResult(1, 2025, start, 1, "A", 2, "B", 110, 100, False),
+        GameResult(2, 2025, start + timedelta(days=1), 2, "B", 3, "C", 99, 101, False),
+        GameResult(3, 2025, start + timedelta(days=2), 3, "C", 1, "A", 95, 120, False),
+    ]
+    columns = {
+        "home_team_id": np.array([1, 2, 3]),
+        "away_team_id": np.array([2, 3, 1]),
+        "home_score": np.array([110, 99, 95]),
+        "away_score": np.array([100, 101, 120]),
+    }
+
+    expected = {1: 1500.0, 2: 1500.0, 3: 1500.0}
+    for game in games:
+        expected[game.home_team_id], expected[game.away_team_id] = update_elo(
+            home_elo=expected[game.home_team_id],
+            away_elo=expected[game.away_team_id],
+            home_won=game.home_score > game.away_score,
+            k_factor=20,
+            home_court_adv=65,
+        )
+
+    from_columns = build_ratings_from_columns(columns, k_factor=20, home_court_adv=65)
+    assert from_columns == pytest.approx(expected)
+
+    # Games arrive in any order; the dataclass path has to replay them by date.
+    from_games = build_regular_season_ratings(list(reversed(games)), k_factor=20, home_court_adv=65)
+    assert from_games == pytest.approx(expected)
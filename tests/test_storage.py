@@ -0,0 +1,141 @@
+import subprocess
+import sys
+from collections.abc import Callable
+from dataclasses import fields, replace
+from datetime import datetime, timezone
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from nba_playoff_odds import storage as storage_module
+from nba_playoff_odds.models import GameResult, TeamStanding
+from nba_playoff_odds.storage import DuckDBStorage
+
+
+def _opens_read_only(db_path: Path) -> bool:
+    # DuckDB's file lock is per process, so the reader has to be a separate one.
+    result = subprocess.run(
+        [sys.executable, "-c", f"import duckdb; duckdb.connect({str(db_path)!r}, read_only=True).close()"],
+        capture_output=True,
+    )
+    return result.returncode == 0
+
+
+def _standings(season: int) -> list[TeamStanding]:
+    return [
+        TeamStanding(season=season, team_id=team_id, team_name=f"Team {team_id}", conference="East", wins=41, losses=41)
+        for team_id in range(1, 4)
+    ]
+
+
+def _game(game_id: int, home_score: int, away_score: int) -> GameResult:
+    return GameResult(
+        game_id=game_id,
+        season=2025,
+        game_date=datetime(2025, 1, game_id),
+        home_team_id=1,
+        home_team_name="Team 1",
+        away_team_id=2,
+        away_team_name="Team 2",
+        home_score=home_score,
+        away_score=away_score,
+        postseason=False,
+    )
+
+
+def _scores(storage: DuckDBStorage) -> list[tuple[int, int, int]]:
+    return [(g.game_id, g.home_score, g.away_score) for g in storage.load_silver_games(2025)]
+
+
+def test_upsert_silver_games_keeps_last_duplicate_and_updates_changed_rows(tmp_path: Path) -> None:
+    with DuckDBStorage(tmp_path / "nba.duckdb") as storage:
+        storage.upsert_silver_games([_game(1, 0, 0), _game(2, 100, 90), _game(1, 110, 105)])
+        assert _scores(storage) == [(1, 110, 105), (2, 100, 90)]
+
+        storage.upsert_silver_games([_game(1, 110, 105), _game(2, 100, 90)])
+        assert _scores(storage) == [(1, 110, 105), (2, 100, 90)]
+
+        storage.upsert_silver_games([_game(2, 101, 90), _game(3, 95, 99)])
+        assert _scores(storage) == [(1, 110, 105), (2, 101, 90), (3, 95, 99)]
+
+
+def test_load_silver_games_arrow_matches_load_silver_games(tmp_path: Path) -> None:
+    # Inserted out of date order, with two games sharing a date, so both loaders have to sort.
+    games = [
+        replace(_game(3, 99, 98), game_date=datetime(2025, 1, 1)),
+        _game(2, 101, 90),
+        replace(_game(1, 100, 95), game_date=datetime(2025, 1, 1)),
+        _game(4, 88, 97),
+    ]
+    with DuckDBStorage(tmp_path / "nba.duckdb") as storage:
+        storage.upsert_silver_games(games)
+        table = storage.load_silver_games_arrow(2025)
+        expected = storage.load_silver_games(2025)
+
+    assert table.column_names == [f.name for f in fields(GameResult)]
+    assert [GameResult(**row) for row in table.to_pylist()] == expected
+    assert [g.game_id for g in expected] == [1, 3, 2, 4]
+
+
+def _write_gold(storage: DuckDBStorage, run_ts: datetime, simulations: int) -> None:
+    storage.write_gold_outputs(
+        season=2025,
+        run_ts=run_ts,
+        k_factor=20.0,
+        home_court_adv=65.0,
+        simulations=simulations,
+        championship_odds={1: ("Team 1", 0.6), 2: ("Team 2", 0.4)},
+        conference_odds={"East": {1: ("Team 1", 1.0)}, "West": {2: ("Team 2", 1.0)}},
+        finals_matchups=[("Team 1 vs Team 2", 1.0)],
+    )
+
+
+def _failing_insert_into(table: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    insert_arrow: Callable[..., None] = storage_module._insert_arrow
+
+    def fail_on_table(con: duckdb.DuckDBPyConnection, sql: str, rows: object) -> None:
+        if f"INSERT INTO {table}" in sql:
+            raise RuntimeError(f"insert into {table} failed")
+        insert_arrow(con, sql, rows)
+
+    monkeypatch.setattr(storage_module, "_insert_arrow", fail_on_table)
+
+
+def test_failed_gold_write_keeps_previous_run(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    db_path = tmp_path / "nba.duckdb"
+    first_run = datetime(2025, 3, 1, tzinfo=timezone.utc)
+    with DuckDBStorage(db_path) as storage:
+        _write_gold(storage, first_run, simulations=100)
+        _failing_insert_into("gold_finals_matchups", monkeypatch)
+        with pytest.raises(RuntimeError):
+            _write_gold(storage, datetime(2025, 3, 2, tzinfo=timezone.utc), simulations=200)
+
+    with duckdb.connect(str(db_path), read_only=True) as con:
+        counts = {"gold_championship_odds": 2, "gold_conference_odds": 2, "gold_finals_matchups": 1, "gold_runs": 1}
+        for table, rows in counts.items():
+            query = f"SELECT count(*), min(simulations), max(simulations) FROM {table}"
+            assert con.execute(query).fetchone() == (rows, 100, 100)
+
+
+def test_failed_standings_replace_keeps_previous_rows(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    with DuckDBStorage(tmp_path / "nba.duckdb") as storage:
+        storage.replace_silver_standings(_standings(2025))
+        _failing_insert_into("silver_standings", monkeypatch)
+        with pytest.raises(RuntimeError):
+            storage.replace_silver_standings(_standings(2025)[:1])
+        assert len(storage.load_silver_standings(2025)) == 3
+
+
+def test_idle_storage_does_not_block_read_only_readers(tmp_path: Path) -> None:
+    db_path = tmp_path / "nba.duckdb"
+    writer = DuckDBStorage(db_path)
+    writer.replace_silver_standings(_standings(2025))
+    writer.close()
+
+    idle = DuckDBStorage(db_path)
+    assert _opens_read_only(db_path)
+
+    assert len(idle.load_silver_standings(2025)) == 3
+    idle.close()
+    assert _opens_read_only(db_path)